@@ -4,10 +4,10 @@ from __future__ import annotations
 import asyncio as aio
 import bisect
 import json
-import time
+import os
 import traceback as trc
 from abc import abstractmethod
-from asyncio import FIRST_COMPLETED
+from codecs import getincrementaldecoder
 from collections import Counter
 from datetime import timedelta
 from functools import lru_cache
@@ -15,7 +15,7 @@ from math import floor, log10
 from numbers import Real
 from shutil import which
 from statistics import median
-from sys import stderr, stdin, stdout
+from sys import intern, stderr, stdin, stdout
 from typing import Any
 from typing import Counter as Ctr_t
 from typing import Iterable, NoReturn, Optional, TypeVar, final
@@ -23,6 +23,16 @@ from typing import Iterable, NoReturn, Optional, TypeVar, final
 T = TypeVar("T")
 N = TypeVar("N", int, float)
 
+try:
+    # optional: considerably faster for the small dicts we serialize
+    from orjson import dumps as _orjson_dumps
+
+    def json_dumps(obj: Any) -> str:
+        return _orjson_dumps(obj).decode()
+
+except ImportError:
+    json_dumps = json.dumps
+
 # base 16 tomorrow colors
 # https://chriskempson.github.io/base16/#tomorrow
 
@@ -49,6 +59,17 @@ CHUNK_DEFAULTS = {
     "separator": "false",
     "separator_block_width": 0,
 }
+# the defaults never change: serialize them once and splice the
+# braceless fragment into each chunk
+CHUNK_DEFAULTS_JSON = json.dumps(CHUNK_DEFAULTS)[1:-1]
+
+
+@lru_cache(maxsize=16)
+def mk_pad(pad: int) -> str:
+    """
+    Returns a cached padding string of `pad` spaces.
+    """
+    return " " * pad
 
 
 class PY9Status:
@@ -99,6 +120,9 @@ class PY9Status:
 
         self.units = units
         self.units_by_name = {u.name: u for u in units}
+        # output order is fixed at startup; don't chase unit attributes
+        # on every sweep
+        self._unit_names = tuple(u.name for u in units)
 
         if chunk_kwargs is None:
             self.chunk_kwargs: dict[str, Any] = {}
@@ -108,10 +132,16 @@ class PY9Status:
         self.padding = padding
 
         self.min_sleep = min_sleep
+        self._stdout_fd = stdout.fileno()
+        self._last_line = b""
+        # set by units when their output actually changes; the line
+        # writer sleeps until then
+        self._dirty = aio.Event()
 
         self.unit_outputs = {
+            # noinspection PyProtectedMember
             u.name: u.process_chunk(
-                color('unit "%s" loading' % u.name, VIOLET),
+                u._loading_str,
                 self.padding,
                 **self.chunk_kwargs,
             )
@@ -124,9 +154,21 @@ class PY9Status:
         writes it.
         """
 
-        o = [self.unit_outputs[u.name] for u in self.units]
-        stdout.write("[" + ",".join(it for it in o if it is not None) + "],\n")
-        stdout.flush()
+        outs = self.unit_outputs
+        line = (
+            "["
+            + ",".join(out for name in self._unit_names if (out := outs[name]))
+            + "],\n"
+        ).encode()
+
+        # i3bar redraws on write: stay silent while nothing changed
+        if line == self._last_line:
+            return
+        self._last_line = line
+
+        # one write(2) straight to the fd: no TextIOWrapper locking, no
+        # separate flush
+        os.write(self._stdout_fd, line)
 
     async def read_clicks(self) -> NoReturn:
         rt = aio.StreamReader()
@@ -134,31 +176,90 @@ class PY9Status:
 
         await aio.get_event_loop().connect_read_pipe(lambda: rp, stdin)
 
-        # we can get by without a json parser for this stream, carefully...
-        # "burn" the opening [\n or ,\n
-        await rt.read(2)
+        # the click stream is an endless json array; parse it
+        # incrementally with raw_decode rather than guessing at framing
+        # byte offsets
+        decoder = json.JSONDecoder()
+        # an incremental decoder holds multibyte characters split
+        # across reads instead of mangling them
+        decode = getincrementaldecoder("utf-8")("replace").decode
+        buf = ""
 
         while True:
-            try:
-                raw = await rt.readuntil(b"}")
-                click = json.loads(raw)
-                # noinspection PyProtectedMember
-                self.units_by_name[click.pop("name")]._handle_click(click)
-                # burn the comma
-                await rt.readuntil(b",")
-            finally:
-                continue
+            raw = await rt.read(1024)
+            if not raw:
+                # stdin EOF: i3 is gone and no clicks can ever arrive;
+                # park instead of spinning on empty reads
+                await aio.Event().wait()
+            buf += decode(raw)
+
+            while True:
+                # eat the array opener and inter-click separators
+                buf = buf.lstrip("[, \n")
+                if not buf:
+                    break
+                try:
+                    click, end = decoder.raw_decode(buf)
+                except json.JSONDecodeError:
+                    nxt = buf.find("{", 1)
+                    if nxt < 0:
+                        # incomplete click; wait for more bytes
+                        break
+                    # malformed input: resync at the next object opener
+                    buf = buf[nxt:]
+                    continue
+                buf = buf[end:]
+
+                # a bad click (unknown name, handler bug) must not kill
+                # the reader task
+                # noinspection PyBroadException
+                try:
+                    # noinspection PyProtectedMember
+                    self.units_by_name[click.pop("name")]._handle_click(click)
+                except Exception:
+                    trc.print_exc(file=stderr)
 
     async def line_writer(self) -> NoReturn:
+        # push the initial placeholders, then write only on change, with
+        # min_sleep as a debounce floor
+        self.write_status_line()
         while True:
+            await self._dirty.wait()
+            self._dirty.clear()
             self.write_status_line()
             await aio.sleep(self.min_sleep)
 
+    async def _amain(self) -> NoReturn:
+        # gather keeps a strong reference to every forever-task and
+        # propagates the first crash instead of dying silently
+        await aio.gather(
+            self.read_clicks(),
+            self.line_writer(),
+            *(
+                unit.main_loop(
+                    self.unit_outputs,
+                    self.padding,
+                    self.chunk_kwargs,
+                    self._dirty,
+                )
+                for unit in self.units
+            ),
+        )
+
     def run(self) -> NoReturn:
         """
         The main control loop.
         """
 
+        # uvloop's libuv loop has cheaper timers and pipe transports;
+        # swap it in when available, before the loop is first acquired
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
+
         # header
         stdout.write('{"version":1,"click_events":true}\n[\n')
         stdout.flush()
@@ -167,19 +268,11 @@ class PY9Status:
             stdout.write("[" + self.fail + "],\n")
             stdout.flush()
 
-            while True:
-                time.sleep(1e9)
-
-        aio.get_event_loop().create_task(self.read_clicks())
-        for unit in self.units:
-            aio.get_event_loop().create_task(
-                unit.main_loop(
-                    self.unit_outputs, self.padding, self.chunk_kwargs
-                ),
-            )
-        aio.get_event_loop().create_task(self.line_writer())
+            # park on a never-set event: blocks for free, and the loop
+            # stays alive for signal handling, unlike a sleep() spin
+            aio.run(aio.Event().wait())
 
-        aio.get_event_loop().run_forever()
+        aio.run(self._amain())
 
 
 class PY9Unit:
@@ -204,6 +297,26 @@ class PY9Unit:
 
     name_resolver: Ctr_t[str] = Counter()
 
+    # hot-loop attribute access goes through C-level slots; subclasses
+    # keep their instance dicts for their own state
+    __slots__ = (
+        "name",
+        "poll_interval",
+        "transient_overrides",
+        "permanent_overrides",
+        "_get_chunk",
+        "_fail",
+        "_wakeup",
+        "_last_chunk",
+        "_last_json",
+        "_json_prefix",
+        "_prefix_kwargs",
+        "_base_chunk",
+        "_loading_str",
+        "_fail_str",
+        "__dict__",
+    )
+
     def __init__(
         self, name=None, poll_interval=0.33, requires=None, **kwargs
     ) -> None:
@@ -237,8 +350,28 @@ class PY9Unit:
         name_ix = self.name_resolver[name]
         self.name_resolver[name] += 1
         name += "" if name_ix == 0 else f"_{name_ix}"
+        # names key the output dict on every tick; interning makes those
+        # lookups an identity check
+        name = intern(name)
         self.name = name
 
+        # everything but full_text is static for this unit's no-override
+        # chunks, so render it once; the prefix is rebuilt if the global
+        # chunk kwargs ever change (in practice: never after startup)
+        self._prefix_kwargs: dict[str, Any] = {}
+        self._json_prefix = (
+            "{"
+            + CHUNK_DEFAULTS_JSON
+            + f', "name": {json_dumps(name)}, "full_text": '
+        )
+        # ... and the dict form of the same invariants seeds the
+        # override path
+        self._base_chunk = {**CHUNK_DEFAULTS, "name": name}
+
+        # constant status strings, rendered once
+        self._loading_str = color(f'unit "{name}" loading', VIOLET)
+        self._fail_str = color(f'unit "{name}" failed', BROWN)
+
         self.poll_interval = poll_interval
         # backwards compatibility
         if "ival" in kwargs:
@@ -259,6 +392,11 @@ class PY9Unit:
 
         self._fail: Optional[str] = None
 
+        # (formatted text, rendered json) of the last tick, reused
+        # verbatim when the text repeats with no overrides pending
+        self._last_chunk: Optional[str] = None
+        self._last_json: Optional[str] = None
+
         # used to prod the main loop awake on user click
         self._wakeup = aio.Event()
 
@@ -292,65 +430,114 @@ class PY9Unit:
         if chunk is None:
             return ""
 
-        out = {"full_text": chunk}
-
-        # change some defaults:
-        out.update(CHUNK_DEFAULTS)
+        # common case: no unit-level overrides pending, so only full_text
+        # needs serializing; global kwargs are folded into the cached
+        # prefix on first sight
+        if not (self.permanent_overrides or self.transient_overrides):
+            if kwargs != self._prefix_kwargs:
+                self._prefix_kwargs = dict(kwargs)
+                static = {**self._base_chunk, **kwargs}
+                self._json_prefix = (
+                    "{" + json_dumps(static)[1:-1] + ', "full_text": '
+                )
+            pad_s = mk_pad(pad)
+            return self._json_prefix + json_dumps(pad_s + chunk + pad_s) + "}"
 
-        # set the name
-        out.update({"name": self.name})
+        out = {**self._base_chunk, "full_text": chunk}
+        upd = out.update
 
         # apply any global (kwarg) overrides
-        out.update(kwargs)
+        upd(kwargs)
         # apply any unit-set overrides
-        out.update(self.permanent_overrides)
+        upd(self.permanent_overrides)
         # transient overrides take precedence
-        out.update(self.transient_overrides)
+        upd(self.transient_overrides)
         self.transient_overrides.clear()
 
-        out["full_text"] = f"{' ' * pad}{out['full_text']}{' ' * pad}"
+        pad_s = mk_pad(pad)
+        out["full_text"] = pad_s + out["full_text"] + pad_s
 
-        return json.dumps(out)
+        return json_dumps(out)
 
     async def main_loop(
-        self, d_out: dict[str, str], padding: int, chunk_kwargs: dict[str, Any]
+        self,
+        d_out: dict[str, str],
+        padding: int,
+        chunk_kwargs: dict[str, Any],
+        dirty: Optional[aio.Event] = None,
     ) -> NoReturn:
-        while True:
-            # noinspection PyBroadException
-            try:
-                if self._fail:
-                    raise ValueError
-
-                d_out[self.name] = self.process_chunk(
-                    self.format(await self.read()),
-                    padding,
-                    **chunk_kwargs,
-                )
+        # pre-bind everything the per-tick path touches: these never
+        # rebind for the life of the task, and local loads are much
+        # cheaper than attribute lookups at 3 Hz times N units
+        name = self.name
+        read = self.read
+        fmt = self.format
+        render = self.process_chunk
+        t_over = self.transient_overrides
+        p_over = self.permanent_overrides
+        wakeup_wait = self._wakeup.wait
+        wakeup_clear = self._wakeup.clear
+        loop_time = aio.get_event_loop().time
+        wait_for = aio.wait_for
+
+        fail_render: Optional[str] = None
 
-            except:
-                if self._fail:
-                    fail_str = color(self._fail, BROWN)
+        while True:
+            if self._fail:
+                # known-failed units take a plain branch instead of
+                # raising into the except block every tick; the render
+                # is reused while no overrides are in play
+                if fail_render is None or t_over or p_over:
+                    clean = not (t_over or p_over)
+                    rendered = render(
+                        color(self._fail, BROWN), padding, **chunk_kwargs
+                    )
+                    fail_render = rendered if clean else None
                 else:
-                    fail_str = color(f'unit "{self.name}" failed', BROWN)
-
-                trc.print_exc(file=stderr)
-
-                d_out[self.name] = self.process_chunk(
-                    fail_str, padding, **chunk_kwargs
-                )
-
-            finally:
-                await aio.wait(
-                    [
-                        aio.create_task(it)
-                        for it in (
-                            aio.sleep(self.poll_interval),
-                            self._wakeup.wait(),
-                        )
-                    ],
-                    return_when=FIRST_COMPLETED,
-                )
-                self._wakeup.clear()
+                    rendered = fail_render
+            else:
+                # noinspection PyBroadException
+                try:
+                    chunk = fmt(await read())
+
+                    if (
+                        chunk is not None
+                        and chunk == self._last_chunk
+                        and not t_over
+                        and not p_over
+                    ):
+                        rendered = self._last_json
+                    else:
+                        # only cache renders untouched by overrides:
+                        # anything else would bake stale overrides into
+                        # the reuse path
+                        clean = not (t_over or p_over)
+                        rendered = render(chunk, padding, **chunk_kwargs)
+                        self._last_chunk = chunk if clean else None
+                        self._last_json = rendered if clean else None
+
+                except Exception:
+                    trc.print_exc(file=stderr)
+                    rendered = render(self._fail_str, padding, **chunk_kwargs)
+
+            # only wake the line writer when our output actually changed
+            if d_out.get(name) != rendered:
+                d_out[name] = rendered
+                if dirty is not None:
+                    dirty.set()
+
+            # snap deadlines to multiples of the poll interval on the
+            # loop clock: units sharing an interval then share a wake
+            ival = self.poll_interval
+            delay = ival - loop_time() % ival
+            # a timed wait on the wakeup event costs one future per
+            # tick, where racing two tasks under aio.wait cost two
+            # tasks plus cancellation bookkeeping
+            try:
+                await wait_for(wakeup_wait(), timeout=delay)
+            except aio.TimeoutError:
+                pass
+            wakeup_clear()
 
     @abstractmethod
     async def read(self) -> dict[str, Any]:
@@ -380,19 +567,14 @@ class PY9Unit:
 
         See i3 documentation and example code for click's members
         """
-        self.transient_overrides.update({"border": RED})
+        self.transient_overrides["border"] = RED
 
 
 def mk_tcolor_str(temp: int | float) -> str:
     if temp < 100:
-        out = color(
-            "{:3.0f}".format(temp),
-            get_color(temp, breakpoints=(30, 50, 70, 90)),
-        )
+        out = color(f"{temp:3.0f}", TCOLOR_TABLE[max(int(temp), 0)])
     else:  # we're on fire
-        out = pangofy(
-            "{:3.0f}".format(temp), color="#FFFFFF", background="#FF0000"
-        )
+        out = pangofy(f"{temp:3.0f}", color="#FFFFFF", background="#FF0000")
 
     return out
 
@@ -412,10 +594,17 @@ def get_color(
 
     assert len(colors) - len(breakpoints) == 1
 
-    if do_reverse:
-        colors = list(reversed(colors))
+    # bisect takes any sequence, and reversal is just end-relative
+    # indexing: no per-call copies needed
+    ix = bisect.bisect(breakpoints, value)
+    return colors[-1 - ix] if do_reverse else colors[ix]
 
-    return colors[bisect.bisect(list(breakpoints), value)]
+
+# temperature color per integer degree; the breakpoints are integral so
+# flooring the reading cannot change the bucket
+TCOLOR_TABLE = tuple(
+    get_color(t, breakpoints=(30, 50, 70, 90)) for t in range(100)
+)
 
 
 def pangofy(s: str, **kwargs) -> str:
@@ -423,20 +612,14 @@ def pangofy(s: str, **kwargs) -> str:
     applies kwargs to s, pango style, returning a <span> element
     """
 
-    a = (
-        "<span "
-        + " ".join(
-            ["{}='{}'".format(k, v) for k, v in kwargs.items() if v is not None]
-        )
-        + ">"
-    )
-    b = "</span>"
-
-    return a + s + b
+    attrs = " ".join(f"{k}='{v}'" for k, v in kwargs.items())
+    return f"<span {attrs}>{s}</span>"
 
 
+@lru_cache(maxsize=4096)
 def color(s: str, color: str) -> str:
-    return pangofy(s, color=color)
+    # color-only spans dominate; skip pangofy's generic attribute walk
+    return f"<span color='{color}'>{s}</span>"
 
 
 def colorize_float(
@@ -447,6 +630,27 @@ def colorize_float(
     )
 
 
+# sub-minute magnitude ladder: scale factor and unit letter per band
+_DUR_SMALL_THRESH = (1e-9, 1e-6, 1e-3, 1.0)
+_DUR_SMALL_PARAMS = (
+    (1e12, "ps"),
+    (1e9, "ns"),
+    (1e6, "us"),
+    (1e3, "ms"),
+    (1, "s"),
+)
+
+# two-unit ladder: major divisor, minor divisor and unit letters per band
+_DUR_BIG_THRESH = (3600, 86400, 604800, 31557600)
+_DUR_BIG_PARAMS = (
+    (60, 1, "m", "s"),
+    (3600, 60, "h", "m"),
+    (86400, 3600, "d", "h"),
+    (604800, 86400, "w", "d"),
+    (31557600, 604800, "y", "w"),
+)
+
+
 @lru_cache(maxsize=1024)
 def format_duration(val: timedelta | Real) -> str:
     """
@@ -459,48 +663,19 @@ def format_duration(val: timedelta | Real) -> str:
         val = val.seconds + 1e-6 * val.microseconds
 
     if val < 60:
-        if val < 1e-9:
-            unit = "ps"
-            display_val = val * 1e12
-        elif val < 1e-6:
-            unit = "ns"
-            display_val = val * 1e9
-        elif val < 1e-3:
-            unit = "us"
-            display_val = val * 1e6
-        elif val < 1.0:
-            unit = "ms"
-            display_val = val * 1e3
-        else:
-            unit = "s"
-            display_val = val
-
+        mult, unit = _DUR_SMALL_PARAMS[bisect.bisect(_DUR_SMALL_THRESH, val)]
+        display_val = val * mult
         precision = max(0, 2 - floor(log10(display_val)))
 
         return f"  {display_val: >3.{precision}f} {unit} "
 
-    # val (- [minute, four weeks)
-    elif 60 <= val < 3155760000:
-        if val < 3600:
-            fst, snd_s = divmod(val, 60)
-            snd = int(snd_s)
-            first_unit, second_unit = "m", "s"
-        elif val < 86400:
-            fst, snd_s = divmod(val, 3600)
-            snd = int(snd_s / 60)
-            first_unit, second_unit = "h", "m"
-        elif val < 604800:
-            fst, snd_s = divmod(val, 86400)
-            snd = int(snd_s / 3600)
-            first_unit, second_unit = "d", "h"
-        elif val < 31557600:
-            fst, snd_s = divmod(val, 604800)
-            snd = int(snd_s / 86400)
-            first_unit, second_unit = "w", "d"
-        else:
-            fst, snd_s = divmod(val, 31557600)
-            snd = int(snd_s / 604800)
-            first_unit, second_unit = "y", "w"
+    # val (- [minute, ten years)
+    elif val < 3155760000:
+        div, subdiv, first_unit, second_unit = _DUR_BIG_PARAMS[
+            bisect.bisect(_DUR_BIG_THRESH, val)
+        ]
+        fst, snd_s = divmod(val, div)
+        snd = int(snd_s / subdiv)
 
         return f"{int(fst): >2d} {first_unit} {snd: >2d} {second_unit}"
 
@@ -512,9 +687,16 @@ def maybe_int(x: T) -> T | int:
     """
     Converts a value to an int if possible, else returns the input unchanged.
     """
+    # convert-only fast path for plain decimal strings, the common
+    # case; anything isdecimal rejects that int() still accepts
+    # (signs, whitespace, underscores) falls through to int() below
+    if isinstance(x, str):
+        digits = x[1:] if x[:1] == "-" else x
+        if digits.isdecimal():
+            return int(x)
     try:
         return int(x)
-    except ValueError:
+    except (TypeError, ValueError):
         return x
 
 
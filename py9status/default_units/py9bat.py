@@ -1,6 +1,5 @@
 from atexit import register as atexit_register
 from collections import deque
-from statistics import mean
 from typing import Deque as dq_t
 
 from py9status.core import (
@@ -48,6 +47,8 @@ class PY9Bat(PY9Unit):
         self.P_hist: dq_t[float] = deque(
             [], maxlen=int(10 / self.poll_interval)
         )
+        # running sum of P_hist, maintained incrementally as in PY9CPU
+        self._P_tot = 0.0
 
         self.f_uevent = open(f"/sys/class/power_supply/BAT{bat_id}/uevent")
         atexit_register(self.f_uevent.close)
@@ -147,8 +148,13 @@ class PY9Bat(PY9Unit):
         except KeyError:
             return {"err_bad_format": True}
 
+        # before append!
+        if len(self.P_hist) == self.P_hist.maxlen:
+            self._P_tot -= self.P_hist[0]
+
         self.P_hist.append(P)
-        av_p = mean(self.P_hist)
+        self._P_tot += P
+        av_p = self._P_tot / len(self.P_hist)
 
         out = {"charged_f": charged_f, "charged_f_design": charged_f_design}
 
@@ -174,6 +180,7 @@ class PY9Bat(PY9Unit):
             self.min_rem_smooth = None
             self._cur_status = status
             self.P_hist.clear()
+            self._P_tot = 0.0
 
         if status == self.STATUS_CHR:
             sec_rem = (Emx - E) / av_p
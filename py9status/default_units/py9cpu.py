@@ -1,10 +1,10 @@
 import re
 import time
+from asyncio import subprocess as asbp
 from atexit import register as atexit_register
 from collections import deque
 from glob import glob
 from shutil import which
-from subprocess import check_output
 
 from typing import Deque as dq_t, Tuple
 
@@ -17,15 +17,18 @@ class PY9CPU(PY9Unit):
     Monitors CPU usage and temperature.
     """
 
-    AMD_RYZEN_PAT1 = re.compile(r"Tccd1:\s+\+([0-9]{2}\.[0-9])", re.MULTILINE)
-    AMD_RYZEN_PAT2 = re.compile(r"Tccd2:\s+\+([0-9]{2}\.[0-9])", re.MULTILINE)
+    # bytes patterns: sensors output is parsed without a decode pass
+    AMD_RYZEN_PAT1 = re.compile(rb"Tccd1:\s+\+([0-9]{2}\.[0-9])", re.MULTILINE)
+    AMD_RYZEN_PAT2 = re.compile(rb"Tccd2:\s+\+([0-9]{2}\.[0-9])", re.MULTILINE)
 
     @staticmethod
     def get_cpuinfo():
         with open("/proc/cpuinfo") as f:
-            raw = f.read()
-
-        return re.findall(r"^model name:\s+(.*)$", raw, re.MULTILINE)
+            return [
+                line.split(":", 1)[1].strip()
+                for line in f
+                if line.startswith("model name")
+            ]
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
@@ -36,6 +39,14 @@ class PY9CPU(PY9Unit):
         else:
             self.no_temps = False
 
+        # keep the thermal zone files open: they are read every tick
+        self._thermal_files = []
+        if self.is_intel:
+            for fn in glob("/sys/class/thermal/thermal_zone*/temp"):
+                f = open(fn, "r")
+                atexit_register(f.close)
+                self._thermal_files.append(f)
+
         self.stat_file = open("/proc/stat", "r")
         atexit_register(self.stat_file.close)
 
@@ -61,16 +72,17 @@ class PY9CPU(PY9Unit):
         comps = [int(x) for x in self.stat_file.readline().split(" ")[1:] if x]
         return sum(comps), comps[0] + comps[1], comps[2]
 
-    def _read_temp(self) -> float:
+    async def _read_temp(self) -> float:
         if self.is_intel:
             return self._read_temp_intel()
         else:
-            return self._read_temp_amd()
+            return await self._read_temp_amd()
 
-    def _read_temp_amd(self) -> float:
-        sensors_raw = check_output("sensors").decode("utf-8")
+    async def _read_temp_amd(self) -> float:
+        proc = await asbp.create_subprocess_exec("sensors", stdout=asbp.PIPE)
+        sensors_raw, _ = await proc.communicate()
         t1 = float(self.AMD_RYZEN_PAT1.findall(sensors_raw)[0])
-        t2 = float(self.AMD_RYZEN_PAT1.findall(sensors_raw)[0])
+        t2 = float(self.AMD_RYZEN_PAT2.findall(sensors_raw)[0])
         return (t1 + t2) / 2
 
     def _read_temp_intel(self) -> float:
@@ -78,13 +90,13 @@ class PY9CPU(PY9Unit):
         temp: float = 0.0
         n_cores = 0
 
-        for fn in glob("/sys/class/thermal/thermal_zone*/temp"):
-            with open(fn, "r") as f:
-                try:
-                    temp += float(f.read()) / 1000
-                    n_cores += 1
-                except ValueError:
-                    continue
+        for f in self._thermal_files:
+            f.seek(0)
+            try:
+                temp += float(f.read()) / 1000
+                n_cores += 1
+            except ValueError:
+                continue
 
         return temp / n_cores
 
@@ -119,7 +131,7 @@ class PY9CPU(PY9Unit):
             temp = None
         else:
             try:
-                temp = self._read_temp()
+                temp = await self._read_temp()
                 self._temp_tot += temp
             except ZeroDivisionError:
                 out["err_no_temp"] = True
@@ -35,7 +35,11 @@ class PY9Disk(PY9Unit):
         """
         with open(self.stat_fn, "r") as f:
             spl = f.read().split()
-            return self._ss * int(spl[2]), self._ss * int(spl[6]), time.time()
+            return (
+                self._ss * int(spl[2]),
+                self._ss * int(spl[6]),
+                time.monotonic(),
+            )
 
     def _get_sector_size(self) -> int:
         candidates = glob("/sys/block/*")
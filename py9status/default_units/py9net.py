@@ -2,6 +2,7 @@ import os
 import re
 import subprocess as sbp
 import time
+from atexit import register as atexit_register
 from collections import deque
 from threading import Event, Thread
 from typing import Deque, Optional, Tuple
@@ -76,7 +77,7 @@ class Pinger:
 
         while not self._halt.is_set():
             self._parse_ping(self._pipefile.readline())
-            self._ping_last_response = time.time()
+            self._ping_last_response = time.monotonic()
 
     def start(self) -> None:
         if self._ping_last_response is not None:
@@ -85,7 +86,7 @@ class Pinger:
                 "Instantiate a new Pinger to reset state."
             )
 
-        self._ping_last_response = time.time()
+        self._ping_last_response = time.monotonic()
         _read_pipe, _write_pipe = os.pipe()
 
         self._proc = sbp.Popen(
@@ -109,7 +110,7 @@ class Pinger:
         self,
     ) -> Tuple[int, Optional[Tuple[float, float, float, float]]]:
 
-        if time.time() - self._ping_last_response > self.timeout:
+        if time.monotonic() - self._ping_last_response > self.timeout:
             return self.PING_TIMEOUT, None
 
         elif self._ping_status is not None:
@@ -135,6 +136,18 @@ class PY9Net(PY9Unit):
     Monitor bytes sent and received per unit time on a network interface.
     """
 
+    # colored rate suffixes, precomputed once and indexed by
+    # bit_length() // 10 of the rate
+    RATE_SUFFIXES = (
+        color("B/s", GREY),
+        "K/s",
+        color("M/s", WHITE),
+        color("G/s", VIOLET),
+    )
+
+    # how many ticks to trust a seen-up link before re-reading operstate
+    LINK_TTL = 5
+
     def __init__(
         self, interface, *args, ping_server="8.8.8.8", **kwargs
     ) -> None:
@@ -149,8 +162,10 @@ class PY9Net(PY9Unit):
         self.interface = interface
         self.ping_server = ping_server
 
-        self.rx_file = f"/sys/class/net/{interface}/statistics/rx_bytes"
-        self.tx_file = f"/sys/class/net/{interface}/statistics/tx_bytes"
+        # a single /proc/net/dev read covers both directions, where the
+        # sysfs statistics files would cost one open+read each
+        self.netdev_file = open("/proc/net/dev", "r")
+        atexit_register(self.netdev_file.close)
         self.operfile = f"/sys/class/net/{interface}/operstate"
 
         self._rx_dq: Deque[int] = deque([], maxlen=int(2 / self.poll_interval))
@@ -160,13 +175,17 @@ class PY9Net(PY9Unit):
         )
 
         self.pinger = None
+        self._link_ttl = 0
 
     def _get_rx_tx(self) -> Tuple[int, int]:
-        with open(self.rx_file, "r") as f:
-            rx = int(f.read())
-        with open(self.tx_file, "r") as f:
-            tx = int(f.read())
-        return rx, tx
+        self.netdev_file.seek(0)
+        for line in self.netdev_file:
+            head, colon, rest = line.partition(":")
+            if colon and head.strip() == self.interface:
+                fields = rest.split()
+                # bytes received is field 0, bytes sent is field 8
+                return int(fields[0]), int(fields[8])
+        raise OSError(f"interface {self.interface} not in /proc/net/dev")
 
     async def read(self) -> DSA:
         """
@@ -193,21 +212,31 @@ class PY9Net(PY9Unit):
 
         """
 
+        # a link seen up last tick is almost certainly still up; only
+        # re-read operstate every LINK_TTL ticks
+        if self._link_ttl > 0:
+            self._link_ttl -= 1
+        else:
+            try:
+                with open(self.operfile, "r") as f:
+                    if "down" in f.read():
+                        self._rx_dq.clear()
+                        self._tx_dq.clear()
+                        self._time_dq.clear()
+                        return {"err_if_down": True}
+            except OSError:
+                return {"err_if_gone": True}
+            self._link_ttl = self.LINK_TTL
+
         try:
-            with open(self.operfile, "r") as f:
-                if "down" in f.read():
-                    self._rx_dq.clear()
-                    self._tx_dq.clear()
-                    self._time_dq.clear()
-                    return {"err_if_down": True}
+            rx, tx = self._get_rx_tx()
         except OSError:
+            self._link_ttl = 0
             return {"err_if_gone": True}
 
-        rx, tx = self._get_rx_tx()
-
         self._rx_dq.append(rx)
         self._tx_dq.append(tx)
-        self._time_dq.append(time.time())
+        self._time_dq.append(time.monotonic())
 
         out = {}
 
@@ -261,19 +290,15 @@ class PY9Net(PY9Unit):
         if output.pop("err_if_loading", False):
             return prefix + color("loading", VIOLET)
 
-        sfs = [color("B/s", GREY), color("B/s", GREY)]
+        sfs = []
         vals = [output["Bps_down"], output["Bps_up"]]
 
         for ix in range(2):
-            for mag, sf in [
-                (30, color("G/s", VIOLET)),
-                (20, color("M/s", WHITE)),
-                (10, "K/s"),
-            ]:
-                if vals[ix] > 1 << mag:
-                    vals[ix] /= 1 << mag
-                    sfs[ix] = sf
-                    break
+            # the magnitude falls straight out of the bit length, no
+            # threshold scan needed
+            mag = min((max(int(vals[ix]), 1).bit_length() - 1) // 10, 3)
+            vals[ix] /= 1 << (10 * mag)
+            sfs.append(self.RATE_SUFFIXES[mag])
 
         return (
             prefix
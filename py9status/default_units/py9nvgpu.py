@@ -1,5 +1,4 @@
 from asyncio import subprocess as asbp
-from re import findall
 
 from py9status.core import PY9Unit, color, get_color, mk_tcolor_str
 from py9status.default_units import DSA
@@ -19,22 +18,41 @@ class PY9NVGPU(PY9Unit):
         'i_temp_C': GPU temperature, deg C
     """
 
+    QUERY = (
+        "--query-gpu=temperature.gpu,memory.used,memory.total,utilization.gpu"
+    )
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, requires=["nvidia-smi"], **kwargs)
+        # spawned lazily on first read, once the event loop is running
+        self.proc = None
 
-    async def read(self) -> DSA:
-        proc = await asbp.create_subprocess_shell(
-            "nvidia-smi", stdout=asbp.PIPE
+    async def _spawn_smi(self) -> None:
+        # -i 0: one line per interval; without it -lms emits a line per
+        # GPU and a single readline per tick would fall ever further
+        # behind on multi-GPU machines
+        self.proc = await asbp.create_subprocess_exec(
+            "nvidia-smi",
+            "-i",
+            "0",
+            self.QUERY,
+            "--format=csv,noheader,nounits",
+            "-lms",
+            str(int(self.poll_interval * 1000)),
+            stdout=asbp.PIPE,
         )
-        raw, _ = await proc.communicate()
-        out = raw.decode("ascii")
-        line = out.split("\n")[8]
 
-        temp_C = int(findall(r"(?<= )[0-9]{2,3}(?=C )", line)[0])
-        mem_mib = int(findall(r"[0-9]+(?=MiB /)", line)[0])
-        mem_tot = int(findall(r"[0-9]{2,}(?=MiB \|)", line)[0])
+    async def read(self) -> DSA:
+        # keep one nvidia-smi alive and have it push us a line per
+        # interval: NVML init/teardown never hits the polling path
+        if self.proc is None:
+            await self._spawn_smi()
+
+        raw = await self.proc.stdout.readline()
+
+        # int() eats ascii bytes directly, so no decode pass is needed
+        temp_C, mem_mib, mem_tot, load_pct = (int(x) for x in raw.split(b","))
         mem_pct = int(100 * mem_mib / mem_tot)
-        load_pct = int(findall(r"[0-9]+(?=% +Def)", line)[0])
 
         return {
             "i_mem_mib": mem_mib,
@@ -48,9 +66,11 @@ class PY9NVGPU(PY9Unit):
         mp = output["i_mem_pct"]
         lp = output["i_load_pct"]
         temp = output["i_temp_C"]
-        return "gpu [mem used {} MiB ({}%)] [load {}%] [temp {}C]".format(
-            color("{: 4d}".format(mm), get_color(mp)),
-            color("{: 3d}".format(mp), get_color(mp)),
-            color("{: 3d}".format(lp), get_color(lp)),
-            mk_tcolor_str(temp),
+        mem_str = color(f"{mm: 4d}", get_color(mp))
+        mem_pct_str = color(f"{mp: 3d}", get_color(mp))
+        load_str = color(f"{lp: 3d}", get_color(lp))
+
+        return (
+            f"gpu [mem used {mem_str} MiB ({mem_pct_str}%)] "
+            f"[load {load_str}%] [temp {mk_tcolor_str(temp)}C]"
         )
@@ -1,4 +1,4 @@
-from datetime import datetime as dtt
+import time
 from multiprocessing import cpu_count
 from typing import Tuple
 
@@ -25,6 +25,11 @@ class PY9Time(PY9Unit):
         self.uptime_fn = "/proc/uptime"
         self.loadavg_fn = "/proc/loadavg"
 
+        # strftime output has one-second resolution, so re-render it at
+        # most once per second regardless of the poll interval
+        self._datestr = ""
+        self._last_sec = -1
+
         self._doing_uptime = False
 
         _cpu_count = cpu_count()
@@ -54,8 +59,13 @@ class PY9Time(PY9Unit):
 
         l1, l5, l10 = self._read_loadavg()
 
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._datestr = time.strftime(self.fmt, time.localtime(sec))
+            self._last_sec = sec
+
         return {
-            "datestr": dtt.now().strftime(self.fmt),
+            "datestr": self._datestr,
             "uptime": self._read_uptime(),
             "loadavg_1": l1,
             "loadavg_5": l5,
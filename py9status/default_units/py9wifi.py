@@ -1,5 +1,6 @@
-import subprocess as sbp
-from re import findall
+import asyncio as aio
+from asyncio import subprocess as asbp
+from re import compile as re_compile
 from typing import Any
 
 from py9status.core import RED, VIOLET, PY9Unit, color, get_color
@@ -11,6 +12,9 @@ class PY9Wireless(PY9Unit):
     Monitors wireless network information.
     """
 
+    SSID_PAT = re_compile(r"\n\s*ssid ([^\n]+)")
+    SIGNAL_PAT = re_compile(r"\n\s*signal:\s*(-\d+)")
+
     def __init__(self, wlan_if: str, *args, **kwargs) -> None:
         """
         Args:
@@ -21,6 +25,13 @@ class PY9Wireless(PY9Unit):
         self.wlan_if = wlan_if
         super().__init__(*args, requires=["iw"], **kwargs)
 
+    async def _iw(self, *args: str) -> str:
+        proc = await asbp.create_subprocess_exec(
+            "iw", "dev", self.wlan_if, *args, stdout=asbp.PIPE
+        )
+        raw, _ = await proc.communicate()
+        return raw.decode("ascii")
+
     async def read(self) -> DSA:
         """
         Returns: dict:
@@ -34,13 +45,11 @@ class PY9Wireless(PY9Unit):
                 "True if there is no network connection.",
 
         """
-        # Raw
-        info = sbp.check_output(["iw", "dev", self.wlan_if, "info"]).decode(
-            "ascii"
+        # Raw; the two iw invocations run concurrently and never block
+        # the event loop
+        info, station = await aio.gather(
+            self._iw("info"), self._iw("station", "dump")
         )
-        station = sbp.check_output(
-            ["iw", "dev", self.wlan_if, "station", "dump"]
-        ).decode("ascii")
 
         # Status
         # No device detected case
@@ -52,8 +61,8 @@ class PY9Wireless(PY9Unit):
             return {"err_disconnected": True}
 
         # Raw output data
-        raw_ssid = findall(r"\n\s*ssid ([^\n]+)", info)[0]
-        power = float(findall(r"\n\s*signal:\s*(-\d+)", station)[0])
+        raw_ssid = self.SSID_PAT.findall(info)[0]
+        power = float(self.SIGNAL_PAT.findall(station)[0])
 
         return {
             "ssid": raw_ssid,
@@ -61,7 +70,7 @@ class PY9Wireless(PY9Unit):
         }
 
     def format(self, output: DSA) -> str:
-        prefix = "wlan {} [".format(self.wlan_if)
+        prefix = f"wlan {self.wlan_if} ["
         suffix = "]"
 
         if output.pop("err_down", False):
@@ -70,14 +79,12 @@ class PY9Wireless(PY9Unit):
         elif output.pop("err_disconnected", False):
             return prefix + color("---", VIOLET) + suffix
 
-        template = prefix + "{}] [{}%" + suffix
         quality = 100 * output["quality"]
         q_color = get_color(quality, do_reverse=True)
-        q_str = color("{:3.0f}".format(quality), q_color)
+        q_str = color(f"{quality:3.0f}", q_color)
+        ssid = output["ssid"] if self.show_ssid else "<>"
 
-        return template.format(
-            output["ssid"] if self.show_ssid else "<>", q_str
-        )
+        return f"{prefix}{ssid}] [{q_str}%{suffix}"
 
     def handle_click(self, click: dict[str, Any]) -> None:
 